@@ -1,11 +1,14 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.routes.health import router as health_router
 from app.routes.today import router as today_router
 from fastapi.middleware.cors import CORSMiddleware
 
 
 
-app = FastAPI(title="Hockey Odds API", version="0.1.0")
+# orjson serializes the /today payload several times faster than the
+# stdlib json encoder FastAPI uses by default.
+app = FastAPI(title="Hockey Odds API", version="0.1.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -23,3 +26,27 @@ app.add_middleware(
 
 app.include_router(health_router)
 app.include_router(today_router)
+
+
+@app.on_event("startup")
+async def _init_nhl_client():
+    # One NHLClient (and one connection pool) for the process lifetime
+    # instead of a fresh client per request.
+    from app.services.nhl_client import NHLClient
+    app.state.nhl = NHLClient()
+
+
+@app.on_event("shutdown")
+async def _close_nhl_client():
+    await app.state.nhl.aclose()
+
+
+@app.on_event("startup")
+async def _warm_scoring_kernel():
+    # Pay the Numba JIT compile cost at startup, not on the first /today.
+    try:
+        from app.scoring import kernel
+    except ImportError:
+        return
+    if kernel.NUMBA_AVAILABLE:
+        kernel.warmup()
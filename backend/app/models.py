@@ -1,8 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional
 
 
+# Responses are immutable once built; frozen models skip per-instance
+# __dict__ mutation hooks and keep instances safely shareable from caches.
 class EdgeBreakdown(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     factor: str
     team: Optional[str]
     points: int
@@ -10,17 +14,23 @@ class EdgeBreakdown(BaseModel):
 
 
 class MatchupScore(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     home: int
     away: int
     diff: int  # home - away
 
 
 class MatchupProb(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     home: float
     away: float
 
 
 class MatchupResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     gameId: str
     date: str
     homeTeam: str
@@ -32,5 +42,7 @@ class MatchupResult(BaseModel):
 
 
 class TodayResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     date: str
     matchups: List[MatchupResult]
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+import time
+from fastapi import APIRouter, HTTPException, Request, Response
 from datetime import date as dt_date
 
 from app.services.nhl_client import NHLClient
@@ -7,14 +9,51 @@ from app.models import TodayResponse
 
 router = APIRouter()
 
-@router.get("/today", response_model=TodayResponse)
-async def today():
-    client = NHLClient()
-    today_str = dt_date.today().isoformat()
+# The schedule changes a few times a day at most and scoring is
+# deterministic given the snapshots, so recompute at most once per TTL.
+_TTL_SECONDS = 120
+_cache: dict[str, tuple[float, TodayResponse]] = {}
+
+# Single-flight: on a cache miss only one request recomputes; any request
+# arriving while that's in progress awaits the same future instead of
+# kicking off its own NHL fetches.
+_inflight: dict[str, asyncio.Future] = {}
 
+
+async def _compute_today(today_str: str, client: NHLClient) -> TodayResponse:
     games = await client.get_schedule_today()
     if games is None:
         raise HTTPException(status_code=502, detail="Failed to fetch NHL schedule")
 
-    resp = await build_today_odds(today_str, games, client)
-    return resp
+    return await build_today_odds(today_str, games, client)
+
+
+@router.get("/today", response_model=TodayResponse)
+async def today(request: Request, response: Response):
+    today_str = dt_date.today().isoformat()
+    response.headers["Cache-Control"] = f"public, max-age={_TTL_SECONDS}"
+
+    now = time.monotonic()
+    cached = _cache.get(today_str)
+    if cached is not None and now - cached[0] < _TTL_SECONDS:
+        return cached[1]
+
+    fut = _inflight.get(today_str)
+    if fut is not None:
+        return await asyncio.shield(fut)
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[today_str] = fut
+    try:
+        resp = await _compute_today(today_str, request.app.state.nhl)
+    except BaseException as exc:
+        fut.set_exception(exc)
+        fut.exception()  # mark retrieved even if no one is waiting
+        raise
+    else:
+        fut.set_result(resp)
+        _cache.clear()  # never keep stale dates around
+        _cache[today_str] = (time.monotonic(), resp)
+        return resp
+    finally:
+        _inflight.pop(today_str, None)
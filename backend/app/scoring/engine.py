@@ -1,9 +1,20 @@
+import functools
 import math
 from typing import Any, Dict, List, Tuple
 
 from app.config import settings
-from app.models import EdgeBreakdown
+from app.scoring.types import Edge
 from app.scoring.rules import (
+    _N_FORM_OFFSET,
+    _N_GOALIE_EQUAL,
+    _N_GOALS_MISSING,
+    _N_GOALS_NEUTRAL,
+    _N_H2H_INCOMPLETE,
+    _N_H2H_NONE,
+    _N_HA_MISSING,
+    _N_INJ_NONE,
+    _N_PP_EQUAL,
+    _N_PP_MISSING,
     points_pct_edge,
     home_away_edge,
     injuries_edge,
@@ -11,29 +22,33 @@ from app.scoring.rules import (
     form_edge,
     head_to_head_edge,
     goalie_edge,
+    streak_int,
+)
+
+
+# diff is an integer capped to [-max_abs_diff, max_abs_diff], so the logistic
+# only ever sees 2*cap+1 inputs — precompute them all and index instead of
+# calling math.exp per matchup.
+_CAP = settings.max_abs_diff
+_LOGISTIC_LUT = tuple(
+    1.0 / (1.0 + math.exp(-d / settings.logistic_temperature))
+    for d in range(-_CAP, _CAP + 1)
 )
 
 
 def logistic_prob(diff: int) -> float:
-    capped = max(-settings.max_abs_diff, min(settings.max_abs_diff, diff))
-    T = settings.logistic_temperature
-    return 1.0 / (1.0 + math.exp(-capped / T))
+    d = -_CAP if diff < -_CAP else (_CAP if diff > _CAP else diff)
+    return _LOGISTIC_LUT[d + _CAP]
 
 
-def projected_total_goals(home: Dict[str, Any], away: Dict[str, Any]) -> float:
+@functools.lru_cache(maxsize=4096)
+def _ptg(hgfr: int, hgaw: int, agfr: int, agaw: int) -> float:
     # Quick MVP using ranks (works immediately with your current snapshots)
     base = 6.0
 
     # ranks: 1 best, 32 worst (lower GA rank = better defense)
-    gf_boost = (
-        (16 - int(home.get("goals_for_rank", 16)))
-        + (16 - int(away.get("goals_for_rank", 16)))
-    ) / 16.0
-
-    ga_boost = (
-        (int(home.get("goals_against_rank", 16)) - 16)
-        + (int(away.get("goals_against_rank", 16)) - 16)
-    ) / 16.0
+    gf_boost = ((16 - hgfr) + (16 - agfr)) / 16.0
+    ga_boost = ((hgaw - 16) + (agaw - 16)) / 16.0
 
     total = base + (0.6 * gf_boost) + (0.6 * ga_boost)
 
@@ -46,12 +61,207 @@ def projected_total_goals(home: Dict[str, Any], away: Dict[str, Any]) -> float:
     return float(total)
 
 
+def projected_total_goals(home: Dict[str, Any], away: Dict[str, Any]) -> float:
+    # Pure function of four small-range integer ranks, so memoize on the
+    # rank tuple; coerce to int first to keep the cache keys canonical.
+    return _ptg(
+        int(home.get("goals_for_rank", 16)),
+        int(home.get("goals_against_rank", 16)),
+        int(away.get("goals_for_rank", 16)),
+        int(away.get("goals_against_rank", 16)),
+    )
+
+
+def score_matchup_fused(
+    home: Dict[str, Any],
+    away: Dict[str, Any],
+    h2h: Dict[str, Any] | None,
+) -> Tuple[int, int, int, float, float, float, List[Edge]]:
+    """
+    Single-pass version of score_matchup: all seven rules fused into one
+    function. Every snapshot key is read exactly once into locals up front,
+    then the rule bodies run as straight-line branches appending to the
+    breakdown directly. Output is identical to score_matchup.
+    """
+    home_team = home["team"]
+    away_team = away["team"]
+
+    hp = home.get("points_pct")
+    ap = away.get("points_pct")
+    hh = home.get("home_points_pct")
+    aa = away.get("away_points_pct")
+    h_top15 = int(home.get("out_top15_scorers") or 0)
+    a_top15 = int(away.get("out_top15_scorers") or 0)
+    h_top50 = int(home.get("out_top50_scorers") or 0)
+    a_top50 = int(away.get("out_top50_scorers") or 0)
+    hgfr = home.get("goals_for_rank")
+    hgaw = home.get("goals_against_rank")
+    agfr = away.get("goals_for_rank")
+    agaw = away.get("goals_against_rank")
+    h_last10 = home.get("last10_points_pct")
+    a_last10 = away.get("last10_points_pct")
+    h_si = streak_int(home)
+    a_si = streak_int(away)
+    h_goalie = int(home.get("goalie_factor") or 0)
+    a_goalie = int(away.get("goalie_factor") or 0)
+
+    breakdown: List[Edge] = []
+    append = breakdown.append
+    hs, as_ = 0, 0
+
+    # points_pct
+    if hp is None or ap is None:
+        append(_N_PP_MISSING)
+    elif hp > ap:
+        hs += 5
+        append(Edge(factor="points_pct", team=home_team, points=+5, reason="Higher points%"))
+    elif ap > hp:
+        as_ += 5
+        append(Edge(factor="points_pct", team=away_team, points=+5, reason="Higher points%"))
+    else:
+        append(_N_PP_EQUAL)
+
+    # home_away
+    if hh is None or aa is None:
+        append(_N_HA_MISSING)
+    else:
+        home_winning = hh > 0.5
+        away_winning = aa > 0.5
+        if home_winning and not away_winning:
+            hs += 2
+            append(Edge(factor="home_away", team=home_team, points=+2, reason="Home winning; away losing"))
+        elif away_winning and not home_winning:
+            as_ += 2
+            append(Edge(factor="home_away", team=away_team, points=+2, reason="Away winning; home losing"))
+        elif home_winning:
+            hs += 1
+            append(Edge(factor="home_away", team=home_team, points=+1, reason="Both winning splits; home slight edge"))
+        else:
+            hs += 1
+            append(Edge(factor="home_away", team=home_team, points=+1, reason="Both losing splits; home slight edge"))
+
+    # injuries
+    inj_hit = False
+    if h_top15 > 0:
+        hs -= 5
+        inj_hit = True
+        append(Edge(factor="injuries", team=home_team, points=-5, reason=f"Missing top-15 scorer(s): {h_top15}"))
+    elif h_top50 > 0:
+        hs -= 3
+        inj_hit = True
+        append(Edge(factor="injuries", team=home_team, points=-3, reason=f"Missing top-50 scorer(s): {h_top50}"))
+    if a_top15 > 0:
+        as_ -= 5
+        inj_hit = True
+        append(Edge(factor="injuries", team=away_team, points=-5, reason=f"Missing top-15 scorer(s): {a_top15}"))
+    elif a_top50 > 0:
+        as_ -= 3
+        inj_hit = True
+        append(Edge(factor="injuries", team=away_team, points=-3, reason=f"Missing top-50 scorer(s): {a_top50}"))
+    if not inj_hit:
+        append(_N_INJ_NONE)
+
+    # goals_balance
+    if hgfr is None or hgaw is None or agfr is None or agaw is None:
+        append(_N_GOALS_MISSING)
+    else:
+        home_elite = hgfr <= 15 and hgaw <= 15
+        away_elite = agfr <= 15 and agaw <= 15
+        home_poor = hgfr >= 18 and hgaw >= 18
+        away_poor = agfr >= 18 and agaw >= 18
+        if home_elite and not away_elite:
+            hs += 2
+            append(Edge(factor="goals_balance", team=home_team, points=+2, reason="Top-15 goals for AND top-15 goals against"))
+        elif away_elite and not home_elite:
+            as_ += 2
+            append(Edge(factor="goals_balance", team=away_team, points=+2, reason="Top-15 goals for AND top-15 goals against"))
+        elif home_poor and not away_poor:
+            hs -= 2
+            append(Edge(factor="goals_balance", team=home_team, points=-2, reason="Bottom-15 goals for AND bottom-15 goals against"))
+        elif away_poor and not home_poor:
+            as_ -= 2
+            append(Edge(factor="goals_balance", team=away_team, points=-2, reason="Bottom-15 goals for AND bottom-15 goals against"))
+        else:
+            append(_N_GOALS_NEUTRAL)
+
+    # form (per side, then offset rule)
+    fh = 0
+    if h_last10 is not None and -1 <= h_si <= 1:
+        if h_last10 > 0.5:
+            fh = 2 if h_si == 1 else (-2 if h_si == -1 else 0)
+        elif h_last10 < 0.5:
+            fh = -2 if h_si == -1 else (1 if h_si == 1 else 0)
+    fa = 0
+    if a_last10 is not None and -1 <= a_si <= 1:
+        if a_last10 > 0.5:
+            fa = 2 if a_si == 1 else (-2 if a_si == -1 else 0)
+        elif a_last10 < 0.5:
+            fa = -2 if a_si == -1 else (1 if a_si == 1 else 0)
+
+    if fh == fa:
+        append(_N_FORM_OFFSET)
+    else:
+        if fh != 0:
+            append(Edge(factor="form", team=home_team, points=fh, reason="Last 10 + streak effect"))
+        if fa != 0:
+            append(Edge(factor="form", team=away_team, points=fa, reason="Last 10 + streak effect"))
+        hs += fh
+        as_ += fa
+
+    # goalie
+    if h_goalie == a_goalie:
+        append(_N_GOALIE_EQUAL)
+    elif h_goalie > a_goalie:
+        hs += h_goalie - a_goalie
+        append(Edge(factor="goalie", team=home_team, points=h_goalie - a_goalie, reason="Stronger team goalie (by SV% & usage)"))
+    else:
+        as_ += a_goalie - h_goalie
+        append(Edge(factor="goalie", team=away_team, points=a_goalie - h_goalie, reason="Stronger team goalie (by SV% & usage)"))
+
+    # h2h_recent
+    if not h2h:
+        append(_N_H2H_NONE)
+    else:
+        home_wins = h2h.get("home_wins")
+        away_wins = h2h.get("away_wins")
+        games_found = int(h2h.get("games_found") or 0)
+        if home_wins is None or away_wins is None or games_found <= 0:
+            append(_N_H2H_INCOMPLETE)
+        else:
+            if games_found >= 5:
+                pts = 3
+            elif games_found >= 3:
+                pts = 2
+            elif games_found >= 2:
+                pts = 1
+            else:
+                pts = 0
+            if pts == 0 or home_wins == away_wins:
+                append(Edge(factor="h2h_recent", team=None, points=0, reason=f"Even/too-small H2H sample (n={games_found})"))
+            elif home_wins > away_wins:
+                hs += pts
+                append(Edge(factor="h2h_recent", team=home_team, points=pts, reason=f"Better H2H in last {games_found} games"))
+            else:
+                as_ += pts
+                append(Edge(factor="h2h_recent", team=away_team, points=pts, reason=f"Better H2H in last {games_found} games"))
+
+    diff = hs - as_
+    p_home = logistic_prob(diff)
+    p_away = 1.0 - p_home
+    ptg = projected_total_goals(home, away)
+
+    return hs, as_, diff, p_home, p_away, ptg, breakdown
+
+
 def score_matchup(
     home: Dict[str, Any],
     away: Dict[str, Any],
     h2h: Dict[str, Any] | None,
-) -> Tuple[int, int, int, float, float, float, List[EdgeBreakdown]]:
-    breakdown: List[EdgeBreakdown] = []
+    record_breakdown: bool = True,
+) -> Tuple[int, int, int, float, float, float, List[Edge]]:
+    # With record_breakdown=False the rules skip Edge construction
+    # entirely — callers that only want scores don't pay for reasoning rows.
+    breakdown: List[Edge] | None = [] if record_breakdown else None
     hs, as_ = 0, 0
 
     for fn in (points_pct_edge, home_away_edge, injuries_edge, goals_edge, form_edge, goalie_edge):
@@ -69,4 +279,14 @@ def score_matchup(
 
     ptg = projected_total_goals(home, away)
 
-    return hs, as_, diff, p_home, p_away, ptg, breakdown
+    return hs, as_, diff, p_home, p_away, ptg, breakdown if breakdown is not None else []
+
+
+def score_matchup_fast(
+    home: Dict[str, Any],
+    away: Dict[str, Any],
+    h2h: Dict[str, Any] | None,
+) -> Tuple[int, int, int, float, float, float]:
+    """Scores only, no breakdown rows — for callers that just need odds."""
+    hs, as_, diff, p_home, p_away, ptg, _ = score_matchup(home, away, h2h, record_breakdown=False)
+    return hs, as_, diff, p_home, p_away, ptg
@@ -0,0 +1,311 @@
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.scoring.types import Edge
+from app.scoring.rules import streak_int
+
+
+def logistic_prob_vec(diff: np.ndarray) -> np.ndarray:
+    # clamp + logistic as one fused ufunc expression; np.exp runs the
+    # whole diff vector through SIMD-capable C code in a single call
+    return 1.0 / (
+        1.0
+        + np.exp(
+            -np.clip(diff, -settings.max_abs_diff, settings.max_abs_diff).astype(np.float64)
+            / settings.logistic_temperature
+        )
+    )
+
+
+
+def _float_col(snaps: List[Dict[str, Any]], key: str) -> np.ndarray:
+    return np.fromiter(
+        (s[key] if isinstance(s.get(key), (int, float)) else np.nan for s in snaps),
+        dtype=np.float64,
+        count=len(snaps),
+    )
+
+
+def _int_col(snaps: List[Dict[str, Any]], key: str, missing: int = 0) -> np.ndarray:
+    return np.fromiter(
+        (s[key] if isinstance(s.get(key), int) else missing for s in snaps),
+        dtype=np.int64,
+        count=len(snaps),
+    )
+
+
+def _streak_col(snaps: List[Dict[str, Any]]) -> np.ndarray:
+    return np.fromiter(
+        (streak_int(s) for s in snaps),
+        dtype=np.int64,
+        count=len(snaps),
+    )
+
+
+def score_all(
+    homes: List[Dict[str, Any]],
+    aways: List[Dict[str, Any]],
+    h2hs: List[Optional[Dict[str, Any]]],
+    with_breakdown: bool = True,
+) -> List[Tuple[int, int, int, float, float, float, List[Edge]]]:
+    """
+    Batch version of score_matchup: one vectorized pass over all matchups.
+
+    Stage 1 builds SoA column arrays from the snapshot dicts (NaN / -1
+    sentinels for missing data). Stage 2 runs every rule as NumPy ops on
+    those columns. Stage 3 builds the Edge rows in a single
+    Python pass driven by the masks computed in stage 2, so no math
+    happens per-game in the interpreter.
+
+    Output matches score_matchup element-for-element.
+    """
+    n = len(homes)
+    if n == 0:
+        return []
+
+    # ---- Stage 1: columns ----
+    hp = _float_col(homes, "points_pct")
+    ap = _float_col(aways, "points_pct")
+    hh = _float_col(homes, "home_points_pct")
+    aa = _float_col(aways, "away_points_pct")
+
+    h_top15 = _int_col(homes, "out_top15_scorers")
+    a_top15 = _int_col(aways, "out_top15_scorers")
+    h_top50 = _int_col(homes, "out_top50_scorers")
+    a_top50 = _int_col(aways, "out_top50_scorers")
+
+    hgfr = _int_col(homes, "goals_for_rank", missing=-1)
+    hgaw = _int_col(homes, "goals_against_rank", missing=-1)
+    agfr = _int_col(aways, "goals_for_rank", missing=-1)
+    agaw = _int_col(aways, "goals_against_rank", missing=-1)
+
+    h_l10 = _float_col(homes, "last10_points_pct")
+    a_l10 = _float_col(aways, "last10_points_pct")
+    h_streak = _streak_col(homes)
+    a_streak = _streak_col(aways)
+
+    h_goalie = _int_col(homes, "goalie_factor")
+    a_goalie = _int_col(aways, "goalie_factor")
+
+    h2h_hw = np.fromiter(
+        ((h or {}).get("home_wins") if isinstance((h or {}).get("home_wins"), int) else -1 for h in h2hs),
+        dtype=np.int64,
+        count=n,
+    )
+    h2h_aw = np.fromiter(
+        ((h or {}).get("away_wins") if isinstance((h or {}).get("away_wins"), int) else -1 for h in h2hs),
+        dtype=np.int64,
+        count=n,
+    )
+    h2h_n = np.fromiter(
+        (int((h or {}).get("games_found") or 0) for h in h2hs),
+        dtype=np.int64,
+        count=n,
+    )
+    h2h_present = np.fromiter((bool(h) for h in h2hs), dtype=np.bool_, count=n)
+
+    hs = np.zeros(n, dtype=np.int64)
+    as_ = np.zeros(n, dtype=np.int64)
+
+    # ---- Stage 2: rules as NumPy ops ----
+
+    # points_pct_edge
+    pp_missing = np.isnan(hp) | np.isnan(ap)
+    pp_home = ~pp_missing & (hp > ap)
+    pp_away = ~pp_missing & (ap > hp)
+    hs += np.where(pp_home, 5, 0)
+    as_ += np.where(pp_away, 5, 0)
+
+    # home_away_edge
+    ha_missing = np.isnan(hh) | np.isnan(aa)
+    home_winning = ~ha_missing & (hh > 0.5)
+    away_winning = ~ha_missing & (aa > 0.5)
+    ha_strong_home = home_winning & ~away_winning
+    ha_strong_away = away_winning & ~home_winning
+    ha_both = ~ha_missing & (home_winning == away_winning)
+    hs += np.where(ha_strong_home, 2, 0) + np.where(ha_both, 1, 0)
+    as_ += np.where(ha_strong_away, 2, 0)
+
+    # injuries_edge — masked arithmetic instead of selects: bool masks
+    # multiply straight into the deltas
+    h_inj15 = h_top15 > 0
+    h_inj50 = ~h_inj15 & (h_top50 > 0)
+    a_inj15 = a_top15 > 0
+    a_inj50 = ~a_inj15 & (a_top50 > 0)
+    hs += -5 * h_inj15 - 3 * h_inj50
+    as_ += -5 * a_inj15 - 3 * a_inj50
+
+    # goals_edge
+    g_missing = (hgfr < 0) | (hgaw < 0) | (agfr < 0) | (agaw < 0)
+    home_elite = ~g_missing & (hgfr <= 15) & (hgaw <= 15)
+    away_elite = ~g_missing & (agfr <= 15) & (agaw <= 15)
+    home_poor = ~g_missing & (hgfr >= 18) & (hgaw >= 18)
+    away_poor = ~g_missing & (agfr >= 18) & (agaw >= 18)
+    g_home_up = home_elite & ~away_elite
+    g_away_up = away_elite & ~home_elite
+    g_home_down = ~g_home_up & ~g_away_up & home_poor & ~away_poor
+    g_away_down = ~g_home_up & ~g_away_up & away_poor & ~home_poor
+    hs += np.where(g_home_up, 2, 0) + np.where(g_home_down, -2, 0)
+    as_ += np.where(g_away_up, 2, 0) + np.where(g_away_down, -2, 0)
+
+    # form_edge (per side, then offset rule)
+    def _form_side(l10: np.ndarray, streak: np.ndarray) -> np.ndarray:
+        valid = ~np.isnan(l10) & (np.abs(streak) <= 1)
+        above = valid & (l10 > 0.5)
+        below = valid & (l10 < 0.5)
+        w = streak == 1
+        l = streak == -1
+        return (
+            np.where(above & w, 2, 0)
+            + np.where(above & l, -2, 0)
+            + np.where(below & l, -2, 0)
+            + np.where(below & w, 1, 0)
+        )
+
+    form_h = _form_side(h_l10, h_streak)
+    form_a = _form_side(a_l10, a_streak)
+    form_offset = form_h == form_a
+    hs += np.where(form_offset, 0, form_h)
+    as_ += np.where(form_offset, 0, form_a)
+
+    # goalie_edge — winner takes |delta|; max() keeps it branchless
+    goalie_delta = h_goalie - a_goalie
+    hs += np.maximum(goalie_delta, 0)
+    as_ += np.maximum(-goalie_delta, 0)
+
+    # head_to_head_edge
+    h2h_valid = h2h_present & (h2h_hw >= 0) & (h2h_aw >= 0) & (h2h_n > 0)
+    h2h_pts = np.where(h2h_n >= 5, 3, np.where(h2h_n >= 3, 2, np.where(h2h_n >= 2, 1, 0)))
+    h2h_home = h2h_valid & (h2h_pts > 0) & (h2h_hw > h2h_aw)
+    h2h_away = h2h_valid & (h2h_pts > 0) & (h2h_aw > h2h_hw)
+    hs += np.where(h2h_home, h2h_pts, 0)
+    as_ += np.where(h2h_away, h2h_pts, 0)
+
+    # final score / probability / projected total
+    diff = hs - as_
+    p_home = logistic_prob_vec(diff)
+    p_away = 1.0 - p_home
+
+    hgfr_f = np.where(hgfr > 0, hgfr, 16).astype(np.float64)
+    hgaw_f = np.where(hgaw > 0, hgaw, 16).astype(np.float64)
+    agfr_f = np.where(agfr > 0, agfr, 16).astype(np.float64)
+    agaw_f = np.where(agaw > 0, agaw, 16).astype(np.float64)
+    gf_boost = ((16.0 - hgfr_f) + (16.0 - agfr_f)) / 16.0
+    ga_boost = ((hgaw_f - 16.0) + (agaw_f - 16.0)) / 16.0
+    ptg = np.clip(6.0 + 0.6 * gf_boost + 0.6 * ga_boost, 4.0, 8.5)
+
+    if not with_breakdown:
+        return [
+            (
+                int(hs[i]),
+                int(as_[i]),
+                int(diff[i]),
+                float(p_home[i]),
+                float(p_away[i]),
+                float(ptg[i]),
+                [],
+            )
+            for i in range(n)
+        ]
+
+    # ---- Stage 3: breakdown rows from the masks ----
+    results: List[Tuple[int, int, int, float, float, float, List[Edge]]] = []
+    for i in range(n):
+        home_team = homes[i]["team"]
+        away_team = aways[i]["team"]
+        breakdown: List[Edge] = []
+
+        def _add(factor: str, team: Optional[str], points: int, reason: str):
+            breakdown.append(Edge(factor=factor, team=team, points=points, reason=reason))
+
+        # points_pct
+        if pp_missing[i]:
+            _add("points_pct", None, 0, "Missing points% data")
+        elif pp_home[i]:
+            _add("points_pct", home_team, +5, "Higher points%")
+        elif pp_away[i]:
+            _add("points_pct", away_team, +5, "Higher points%")
+        else:
+            _add("points_pct", None, 0, "Equal points%")
+
+        # home_away
+        if ha_missing[i]:
+            _add("home_away", None, 0, "Missing home/away data")
+        elif ha_strong_home[i]:
+            _add("home_away", home_team, +2, "Home winning; away losing")
+        elif ha_strong_away[i]:
+            _add("home_away", away_team, +2, "Away winning; home losing")
+        elif home_winning[i]:
+            _add("home_away", home_team, +1, "Both winning splits; home slight edge")
+        else:
+            _add("home_away", home_team, +1, "Both losing splits; home slight edge")
+
+        # injuries
+        if h_inj15[i]:
+            _add("injuries", home_team, -5, f"Missing top-15 scorer(s): {h_top15[i]}")
+        elif h_inj50[i]:
+            _add("injuries", home_team, -3, f"Missing top-50 scorer(s): {h_top50[i]}")
+        if a_inj15[i]:
+            _add("injuries", away_team, -5, f"Missing top-15 scorer(s): {a_top15[i]}")
+        elif a_inj50[i]:
+            _add("injuries", away_team, -3, f"Missing top-50 scorer(s): {a_top50[i]}")
+        if not (h_inj15[i] or h_inj50[i] or a_inj15[i] or a_inj50[i]):
+            _add("injuries", None, 0, "No significant scoring injuries")
+
+        # goals_balance
+        if g_missing[i]:
+            _add("goals_balance", None, 0, "Missing goals rank data")
+        elif g_home_up[i]:
+            _add("goals_balance", home_team, +2, "Top-15 goals for AND top-15 goals against")
+        elif g_away_up[i]:
+            _add("goals_balance", away_team, +2, "Top-15 goals for AND top-15 goals against")
+        elif g_home_down[i]:
+            _add("goals_balance", home_team, -2, "Bottom-15 goals for AND bottom-15 goals against")
+        elif g_away_down[i]:
+            _add("goals_balance", away_team, -2, "Bottom-15 goals for AND bottom-15 goals against")
+        else:
+            _add("goals_balance", None, 0, "No clear goals balance edge")
+
+        # form
+        if form_offset[i]:
+            _add("form", None, 0, "Form factors offset or equal")
+        else:
+            if form_h[i] != 0:
+                _add("form", home_team, int(form_h[i]), "Last 10 + streak effect")
+            if form_a[i] != 0:
+                _add("form", away_team, int(form_a[i]), "Last 10 + streak effect")
+
+        # goalie
+        if goalie_delta[i] == 0:
+            _add("goalie", None, 0, "Equal team goalie factor")
+        elif goalie_delta[i] > 0:
+            _add("goalie", home_team, int(goalie_delta[i]), "Stronger team goalie (by SV% & usage)")
+        else:
+            _add("goalie", away_team, int(-goalie_delta[i]), "Stronger team goalie (by SV% & usage)")
+
+        # h2h_recent
+        if not h2h_present[i]:
+            _add("h2h_recent", None, 0, "No head-to-head data available")
+        elif not h2h_valid[i]:
+            _add("h2h_recent", None, 0, "Incomplete head-to-head data")
+        elif h2h_home[i]:
+            _add("h2h_recent", home_team, int(h2h_pts[i]), f"Better H2H in last {h2h_n[i]} games")
+        elif h2h_away[i]:
+            _add("h2h_recent", away_team, int(h2h_pts[i]), f"Better H2H in last {h2h_n[i]} games")
+        else:
+            _add("h2h_recent", None, 0, f"Even/too-small H2H sample (n={h2h_n[i]})")
+
+        results.append(
+            (
+                int(hs[i]),
+                int(as_[i]),
+                int(diff[i]),
+                float(p_home[i]),
+                float(p_away[i]),
+                float(ptg[i]),
+                breakdown,
+            )
+        )
+
+    return results
@@ -0,0 +1,464 @@
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+from app.scoring.types import Edge
+from app.scoring.rules import streak_int
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba not installed; kernel runs as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+# Feature column layout for the (N, K) float64 matrix fed to the kernel.
+# Missing floats are NaN; missing ranks are -1; absent h2h is games == -1.
+F_HP = 0          # home points_pct
+F_AP = 1          # away points_pct
+F_HH = 2          # home home_points_pct
+F_AA = 3          # away away_points_pct
+F_H_TOP15 = 4
+F_A_TOP15 = 5
+F_H_TOP50 = 6
+F_A_TOP50 = 7
+F_HGFR = 8
+F_HGAW = 9
+F_AGFR = 10
+F_AGAW = 11
+F_H_L10 = 12
+F_A_L10 = 13
+F_H_STREAK = 14   # W=+1, L=-1, none=0, invalid=99
+F_A_STREAK = 15
+F_H_GOALIE = 16
+F_A_GOALIE = 17
+F_H2H_HW = 18     # NaN when incomplete
+F_H2H_AW = 19
+F_H2H_N = 20      # -1 when no h2h dict at all
+N_FEATURES = 21
+
+
+
+
+def team_features(snap: Dict[str, Any]) -> Tuple[float, ...]:
+    """
+    Per-team numeric feature tuple, independent of matchup side:
+    (points_pct, home_pp, away_pp, top15, top50, gf_rank, ga_rank,
+    last10, streak_code, goalie_factor). Parsed once per team per
+    request and reused for every matchup the team appears in.
+    """
+    def f(v):
+        return float(v) if isinstance(v, (int, float)) else math.nan
+
+    gfr = snap.get("goals_for_rank")
+    gaw = snap.get("goals_against_rank")
+    return (
+        f(snap.get("points_pct")),
+        f(snap.get("home_points_pct")),
+        f(snap.get("away_points_pct")),
+        float(int(snap.get("out_top15_scorers") or 0)),
+        float(int(snap.get("out_top50_scorers") or 0)),
+        float(gfr) if isinstance(gfr, int) else -1.0,
+        float(gaw) if isinstance(gaw, int) else -1.0,
+        f(snap.get("last10_points_pct")),
+        float(streak_int(snap)),
+        float(int(snap.get("goalie_factor") or 0)),
+    )
+
+
+# indices into a team_features tuple
+_TF_PP, _TF_HOME_PP, _TF_AWAY_PP, _TF_TOP15, _TF_TOP50 = 0, 1, 2, 3, 4
+_TF_GFR, _TF_GAW, _TF_L10, _TF_STREAK, _TF_GOALIE = 5, 6, 7, 8, 9
+
+
+def extract_features(
+    homes: List[Dict[str, Any]],
+    aways: List[Dict[str, Any]],
+    h2hs: List[Optional[Dict[str, Any]]],
+    feature_map: Optional[Dict[str, Tuple[float, ...]]] = None,
+) -> np.ndarray:
+    n = len(homes)
+    feats = np.empty((n, N_FEATURES), dtype=np.float64)
+
+    if feature_map is None:
+        feature_map = {}
+
+    for i in range(n):
+        home, away, h2h = homes[i], aways[i], h2hs[i]
+        tf_h = feature_map.get(home["team"])
+        if tf_h is None:
+            tf_h = team_features(home)
+        tf_a = feature_map.get(away["team"])
+        if tf_a is None:
+            tf_a = team_features(away)
+
+        row = feats[i]
+        row[F_HP] = tf_h[_TF_PP]
+        row[F_AP] = tf_a[_TF_PP]
+        row[F_HH] = tf_h[_TF_HOME_PP]
+        row[F_AA] = tf_a[_TF_AWAY_PP]
+        row[F_H_TOP15] = tf_h[_TF_TOP15]
+        row[F_A_TOP15] = tf_a[_TF_TOP15]
+        row[F_H_TOP50] = tf_h[_TF_TOP50]
+        row[F_A_TOP50] = tf_a[_TF_TOP50]
+        row[F_HGFR] = tf_h[_TF_GFR]
+        row[F_HGAW] = tf_h[_TF_GAW]
+        row[F_AGFR] = tf_a[_TF_GFR]
+        row[F_AGAW] = tf_a[_TF_GAW]
+        row[F_H_L10] = tf_h[_TF_L10]
+        row[F_A_L10] = tf_a[_TF_L10]
+        row[F_H_STREAK] = tf_h[_TF_STREAK]
+        row[F_A_STREAK] = tf_a[_TF_STREAK]
+        row[F_H_GOALIE] = tf_h[_TF_GOALIE]
+        row[F_A_GOALIE] = tf_a[_TF_GOALIE]
+        if h2h:
+            hw = h2h.get("home_wins")
+            aw = h2h.get("away_wins")
+            row[F_H2H_HW] = hw if isinstance(hw, int) else math.nan
+            row[F_H2H_AW] = aw if isinstance(aw, int) else math.nan
+            row[F_H2H_N] = int(h2h.get("games_found") or 0)
+        else:
+            row[F_H2H_HW] = math.nan
+            row[F_H2H_AW] = math.nan
+            row[F_H2H_N] = -1
+
+    return feats
+
+
+@njit(cache=True)
+def score_kernel(
+    feats: np.ndarray,
+    cap: int,
+    temperature: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pure-numeric scoring over the feature matrix: no dicts, no strings.
+    Returns (hs, as_, diff, p_home, ptg, branches); branches[i, rule]
+    records which branch each rule took so breakdown text can be built
+    afterwards in Python.
+    """
+    n = feats.shape[0]
+    hs = np.zeros(n, dtype=np.int64)
+    as_ = np.zeros(n, dtype=np.int64)
+    diff = np.zeros(n, dtype=np.int64)
+    p_home = np.zeros(n, dtype=np.float64)
+    ptg = np.zeros(n, dtype=np.float64)
+    branches = np.zeros((n, 7), dtype=np.int8)
+
+    for i in range(n):
+        h = 0
+        a = 0
+
+        # rule 0: points_pct — 0 missing, 1 home, 2 away, 3 equal
+        hp = feats[i, F_HP]
+        ap = feats[i, F_AP]
+        if math.isnan(hp) or math.isnan(ap):
+            branches[i, 0] = 0
+        elif hp > ap:
+            h += 5
+            branches[i, 0] = 1
+        elif ap > hp:
+            a += 5
+            branches[i, 0] = 2
+        else:
+            branches[i, 0] = 3
+
+        # rule 1: home_away — 0 missing, 1 strong home, 2 strong away,
+        # 3 both winning, 4 both losing
+        hhv = feats[i, F_HH]
+        aav = feats[i, F_AA]
+        if math.isnan(hhv) or math.isnan(aav):
+            branches[i, 1] = 0
+        else:
+            hw = hhv > 0.5
+            aw = aav > 0.5
+            if hw and not aw:
+                h += 2
+                branches[i, 1] = 1
+            elif aw and not hw:
+                a += 2
+                branches[i, 1] = 2
+            elif hw:
+                h += 1
+                branches[i, 1] = 3
+            else:
+                h += 1
+                branches[i, 1] = 4
+
+        # rule 2: injuries — bitmask 1=h top15, 2=h top50, 4=a top15, 8=a top50
+        inj = 0
+        if feats[i, F_H_TOP15] > 0:
+            h -= 5
+            inj |= 1
+        elif feats[i, F_H_TOP50] > 0:
+            h -= 3
+            inj |= 2
+        if feats[i, F_A_TOP15] > 0:
+            a -= 5
+            inj |= 4
+        elif feats[i, F_A_TOP50] > 0:
+            a -= 3
+            inj |= 8
+        branches[i, 2] = inj
+
+        # rule 3: goals_balance — 0 missing, 1 home elite, 2 away elite,
+        # 3 home poor, 4 away poor, 5 neutral
+        hgfr = feats[i, F_HGFR]
+        hgaw = feats[i, F_HGAW]
+        agfr = feats[i, F_AGFR]
+        agaw = feats[i, F_AGAW]
+        if hgfr < 0 or hgaw < 0 or agfr < 0 or agaw < 0:
+            branches[i, 3] = 0
+        else:
+            home_elite = hgfr <= 15 and hgaw <= 15
+            away_elite = agfr <= 15 and agaw <= 15
+            home_poor = hgfr >= 18 and hgaw >= 18
+            away_poor = agfr >= 18 and agaw >= 18
+            if home_elite and not away_elite:
+                h += 2
+                branches[i, 3] = 1
+            elif away_elite and not home_elite:
+                a += 2
+                branches[i, 3] = 2
+            elif home_poor and not away_poor:
+                h -= 2
+                branches[i, 3] = 3
+            elif away_poor and not home_poor:
+                a -= 2
+                branches[i, 3] = 4
+            else:
+                branches[i, 3] = 5
+
+        # rule 4: form — branch encodes (fh+2)*5 + (fa+2)
+        fh = 0
+        l10 = feats[i, F_H_L10]
+        st = feats[i, F_H_STREAK]
+        if not math.isnan(l10) and abs(st) <= 1:
+            if l10 > 0.5:
+                fh = 2 if st == 1 else (-2 if st == -1 else 0)
+            elif l10 < 0.5:
+                fh = -2 if st == -1 else (1 if st == 1 else 0)
+        fa = 0
+        l10 = feats[i, F_A_L10]
+        st = feats[i, F_A_STREAK]
+        if not math.isnan(l10) and abs(st) <= 1:
+            if l10 > 0.5:
+                fa = 2 if st == 1 else (-2 if st == -1 else 0)
+            elif l10 < 0.5:
+                fa = -2 if st == -1 else (1 if st == 1 else 0)
+        if fh != fa:
+            h += fh
+            a += fa
+        branches[i, 4] = (fh + 2) * 5 + (fa + 2)
+
+        # rule 5: goalie — 0 equal, 1 home, 2 away (delta from features)
+        gd = int(feats[i, F_H_GOALIE]) - int(feats[i, F_A_GOALIE])
+        if gd > 0:
+            h += gd
+            branches[i, 5] = 1
+        elif gd < 0:
+            a += -gd
+            branches[i, 5] = 2
+        else:
+            branches[i, 5] = 0
+
+        # rule 6: h2h — 0 absent, 1 incomplete, 2 even/too small,
+        # 3 home, 4 away
+        h2h_n = feats[i, F_H2H_N]
+        hw2 = feats[i, F_H2H_HW]
+        aw2 = feats[i, F_H2H_AW]
+        if h2h_n < 0:
+            branches[i, 6] = 0
+        elif math.isnan(hw2) or math.isnan(aw2) or h2h_n <= 0:
+            branches[i, 6] = 1
+        else:
+            if h2h_n >= 5:
+                pts = 3
+            elif h2h_n >= 3:
+                pts = 2
+            elif h2h_n >= 2:
+                pts = 1
+            else:
+                pts = 0
+            if pts == 0 or hw2 == aw2:
+                branches[i, 6] = 2
+            elif hw2 > aw2:
+                h += pts
+                branches[i, 6] = 3
+            else:
+                a += pts
+                branches[i, 6] = 4
+
+        hs[i] = h
+        as_[i] = a
+        d = h - a
+        diff[i] = d
+        capped = -cap if d < -cap else (cap if d > cap else d)
+        p_home[i] = 1.0 / (1.0 + math.exp(-capped / temperature))
+
+        gfr_h = hgfr if hgfr > 0 else 16.0
+        gaw_h = hgaw if hgaw > 0 else 16.0
+        gfr_a = agfr if agfr > 0 else 16.0
+        gaw_a = agaw if agaw > 0 else 16.0
+        total = (
+            6.0
+            + 0.6 * (((16.0 - gfr_h) + (16.0 - gfr_a)) / 16.0)
+            + 0.6 * (((gaw_h - 16.0) + (gaw_a - 16.0)) / 16.0)
+        )
+        if total < 4.0:
+            total = 4.0
+        elif total > 8.5:
+            total = 8.5
+        ptg[i] = total
+
+    return hs, as_, diff, p_home, ptg, branches
+
+
+def _h2h_pts(n: int) -> int:
+    if n >= 5:
+        return 3
+    if n >= 3:
+        return 2
+    if n >= 2:
+        return 1
+    return 0
+
+
+def _build_breakdown(
+    home: Dict[str, Any],
+    away: Dict[str, Any],
+    row: np.ndarray,
+    branch: np.ndarray,
+) -> List[Edge]:
+    home_team = home["team"]
+    away_team = away["team"]
+    breakdown: List[Edge] = []
+    append = breakdown.append
+
+    b = branch[0]
+    if b == 0:
+        append(Edge(factor="points_pct", team=None, points=0, reason="Missing points% data"))
+    elif b == 1:
+        append(Edge(factor="points_pct", team=home_team, points=+5, reason="Higher points%"))
+    elif b == 2:
+        append(Edge(factor="points_pct", team=away_team, points=+5, reason="Higher points%"))
+    else:
+        append(Edge(factor="points_pct", team=None, points=0, reason="Equal points%"))
+
+    b = branch[1]
+    if b == 0:
+        append(Edge(factor="home_away", team=None, points=0, reason="Missing home/away data"))
+    elif b == 1:
+        append(Edge(factor="home_away", team=home_team, points=+2, reason="Home winning; away losing"))
+    elif b == 2:
+        append(Edge(factor="home_away", team=away_team, points=+2, reason="Away winning; home losing"))
+    elif b == 3:
+        append(Edge(factor="home_away", team=home_team, points=+1, reason="Both winning splits; home slight edge"))
+    else:
+        append(Edge(factor="home_away", team=home_team, points=+1, reason="Both losing splits; home slight edge"))
+
+    inj = branch[2]
+    if inj & 1:
+        append(Edge(factor="injuries", team=home_team, points=-5, reason=f"Missing top-15 scorer(s): {int(row[F_H_TOP15])}"))
+    elif inj & 2:
+        append(Edge(factor="injuries", team=home_team, points=-3, reason=f"Missing top-50 scorer(s): {int(row[F_H_TOP50])}"))
+    if inj & 4:
+        append(Edge(factor="injuries", team=away_team, points=-5, reason=f"Missing top-15 scorer(s): {int(row[F_A_TOP15])}"))
+    elif inj & 8:
+        append(Edge(factor="injuries", team=away_team, points=-3, reason=f"Missing top-50 scorer(s): {int(row[F_A_TOP50])}"))
+    if inj == 0:
+        append(Edge(factor="injuries", team=None, points=0, reason="No significant scoring injuries"))
+
+    b = branch[3]
+    if b == 0:
+        append(Edge(factor="goals_balance", team=None, points=0, reason="Missing goals rank data"))
+    elif b == 1:
+        append(Edge(factor="goals_balance", team=home_team, points=+2, reason="Top-15 goals for AND top-15 goals against"))
+    elif b == 2:
+        append(Edge(factor="goals_balance", team=away_team, points=+2, reason="Top-15 goals for AND top-15 goals against"))
+    elif b == 3:
+        append(Edge(factor="goals_balance", team=home_team, points=-2, reason="Bottom-15 goals for AND bottom-15 goals against"))
+    elif b == 4:
+        append(Edge(factor="goals_balance", team=away_team, points=-2, reason="Bottom-15 goals for AND bottom-15 goals against"))
+    else:
+        append(Edge(factor="goals_balance", team=None, points=0, reason="No clear goals balance edge"))
+
+    fh = branch[4] // 5 - 2
+    fa = branch[4] % 5 - 2
+    if fh == fa:
+        append(Edge(factor="form", team=None, points=0, reason="Form factors offset or equal"))
+    else:
+        if fh != 0:
+            append(Edge(factor="form", team=home_team, points=int(fh), reason="Last 10 + streak effect"))
+        if fa != 0:
+            append(Edge(factor="form", team=away_team, points=int(fa), reason="Last 10 + streak effect"))
+
+    b = branch[5]
+    gd = int(row[F_H_GOALIE]) - int(row[F_A_GOALIE])
+    if b == 0:
+        append(Edge(factor="goalie", team=None, points=0, reason="Equal team goalie factor"))
+    elif b == 1:
+        append(Edge(factor="goalie", team=home_team, points=gd, reason="Stronger team goalie (by SV% & usage)"))
+    else:
+        append(Edge(factor="goalie", team=away_team, points=-gd, reason="Stronger team goalie (by SV% & usage)"))
+
+    b = branch[6]
+    n_found = int(row[F_H2H_N])
+    if b == 0:
+        append(Edge(factor="h2h_recent", team=None, points=0, reason="No head-to-head data available"))
+    elif b == 1:
+        append(Edge(factor="h2h_recent", team=None, points=0, reason="Incomplete head-to-head data"))
+    elif b == 2:
+        append(Edge(factor="h2h_recent", team=None, points=0, reason=f"Even/too-small H2H sample (n={n_found})"))
+    elif b == 3:
+        append(Edge(factor="h2h_recent", team=home_team, points=_h2h_pts(n_found), reason=f"Better H2H in last {n_found} games"))
+    else:
+        append(Edge(factor="h2h_recent", team=away_team, points=_h2h_pts(n_found), reason=f"Better H2H in last {n_found} games"))
+
+    return breakdown
+
+
+def score_batch(
+    homes: List[Dict[str, Any]],
+    aways: List[Dict[str, Any]],
+    h2hs: List[Optional[Dict[str, Any]]],
+    feature_map: Optional[Dict[str, Tuple[float, ...]]] = None,
+) -> List[Tuple[int, int, int, float, float, float, List[Edge]]]:
+    """
+    JIT-backed batch scoring: extract numeric features, run score_kernel,
+    then build breakdown rows from the recorded branch codes.
+    """
+    n = len(homes)
+    if n == 0:
+        return []
+
+    feats = extract_features(homes, aways, h2hs, feature_map)
+    hs, as_, diff, p_home, ptg, branches = score_kernel(
+        feats, settings.max_abs_diff, settings.logistic_temperature
+    )
+
+    return [
+        (
+            int(hs[i]),
+            int(as_[i]),
+            int(diff[i]),
+            float(p_home[i]),
+            1.0 - float(p_home[i]),
+            float(ptg[i]),
+            _build_breakdown(homes[i], aways[i], feats[i], branches[i]),
+        )
+        for i in range(n)
+    ]
+
+
+def warmup():
+    """Trigger JIT compilation with a size-1 batch at startup."""
+    feats = np.zeros((1, N_FEATURES), dtype=np.float64)
+    feats[:, F_H2H_N] = -1
+    score_kernel(feats, settings.max_abs_diff, settings.logistic_temperature)
@@ -1,29 +1,75 @@
+import sys
 from typing import Any, Dict, List, Tuple
-from app.models import EdgeBreakdown
+from app.scoring.types import Edge
 
-def _add_edge(breakdown: List[EdgeBreakdown], factor: str, team: str | None, points: int, reason: str):
-    breakdown.append(EdgeBreakdown(factor=factor, team=team, points=points, reason=reason))
+# Factor names and static reasons are drawn from a small fixed set, so
+# keep one interned instance of each instead of materializing fresh
+# strings on every call. Injury reasons vary only by a small count, so
+# the common counts are pre-formatted too.
+_F_POINTS_PCT = sys.intern("points_pct")
+_F_HOME_AWAY = sys.intern("home_away")
+_F_INJURIES = sys.intern("injuries")
+_F_GOALS = sys.intern("goals_balance")
+_F_FORM = sys.intern("form")
+_F_GOALIE = sys.intern("goalie")
+_F_H2H = sys.intern("h2h_recent")
 
-def points_pct_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[EdgeBreakdown]) -> Tuple[int, int]:
+_R_TOP15 = {n: f"Missing top-15 scorer(s): {n}" for n in range(1, 7)}
+_R_TOP50 = {n: f"Missing top-50 scorer(s): {n}" for n in range(1, 7)}
+
+
+def _reason_top15(n: int) -> str:
+    return _R_TOP15.get(n) or f"Missing top-15 scorer(s): {n}"
+
+
+def _reason_top50(n: int) -> str:
+    return _R_TOP50.get(n) or f"Missing top-50 scorer(s): {n}"
+
+
+# Flyweight rows for the neutral/no-data branches: Edge is frozen, so one
+# shared instance per branch is safe and skips an allocation per call.
+_N_PP_MISSING = Edge(factor=_F_POINTS_PCT, team=None, points=0, reason="Missing points% data")
+_N_PP_EQUAL = Edge(factor=_F_POINTS_PCT, team=None, points=0, reason="Equal points%")
+_N_HA_MISSING = Edge(factor=_F_HOME_AWAY, team=None, points=0, reason="Missing home/away data")
+_N_HA_NEUTRAL = Edge(factor=_F_HOME_AWAY, team=None, points=0, reason="No meaningful split edge")
+_N_INJ_NONE = Edge(factor=_F_INJURIES, team=None, points=0, reason="No significant scoring injuries")
+_N_GOALS_MISSING = Edge(factor=_F_GOALS, team=None, points=0, reason="Missing goals rank data")
+_N_GOALS_NEUTRAL = Edge(factor=_F_GOALS, team=None, points=0, reason="No clear goals balance edge")
+_N_FORM_OFFSET = Edge(factor=_F_FORM, team=None, points=0, reason="Form factors offset or equal")
+_N_GOALIE_EQUAL = Edge(factor=_F_GOALIE, team=None, points=0, reason="Equal team goalie factor")
+_N_H2H_NONE = Edge(factor=_F_H2H, team=None, points=0, reason="No head-to-head data available")
+_N_H2H_INCOMPLETE = Edge(factor=_F_H2H, team=None, points=0, reason="Incomplete head-to-head data")
+
+
+def _add_shared(breakdown: List[Edge] | None, edge: Edge):
+    if breakdown is not None:
+        breakdown.append(edge)
+
+def _add_edge(breakdown: List[Edge] | None, factor: str, team: str | None, points: int, reason: str):
+    # callers that only need scores pass breakdown=None to skip row creation
+    if breakdown is not None:
+        breakdown.append(Edge(factor=factor, team=team, points=points, reason=reason))
+
+def points_pct_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[Edge] | None) -> Tuple[int, int]:
     hp = home.get("points_pct")
     ap = away.get("points_pct")
     if hp is None or ap is None:
-        _add_edge(breakdown, "points_pct", None, 0, "Missing points% data")
+        _add_shared(breakdown, _N_PP_MISSING)
         return 0, 0
     if hp > ap:
-        _add_edge(breakdown, "points_pct", home["team"], +5, "Higher points%")
+        _add_edge(breakdown, _F_POINTS_PCT, home["team"], +5, "Higher points%")
         return +5, 0
     if ap > hp:
-        _add_edge(breakdown, "points_pct", away["team"], +5, "Higher points%")
+        _add_edge(breakdown, _F_POINTS_PCT, away["team"], +5, "Higher points%")
         return 0, +5
-    _add_edge(breakdown, "points_pct", None, 0, "Equal points%")
+    _add_shared(breakdown, _N_PP_EQUAL)
     return 0, 0
 
-def home_away_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[EdgeBreakdown]) -> Tuple[int, int]:
+def home_away_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[Edge] | None) -> Tuple[int, int]:
     hh = home.get("home_points_pct")
     aa = away.get("away_points_pct")
     if hh is None or aa is None:
-        _add_edge(breakdown, "home_away", None, 0, "Missing home/away data")
+        _add_shared(breakdown, _N_HA_MISSING)
         return 0, 0
 
     home_winning = hh > 0.5
@@ -31,26 +77,26 @@ def home_away_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[E
 
     # Strong edge cases
     if home_winning and not away_winning:
-        _add_edge(breakdown, "home_away", home["team"], +2, "Home winning; away losing")
+        _add_edge(breakdown, _F_HOME_AWAY, home["team"], +2, "Home winning; away losing")
         return +2, 0
     if away_winning and not home_winning:
-        _add_edge(breakdown, "home_away", away["team"], +2, "Away winning; home losing")
+        _add_edge(breakdown, _F_HOME_AWAY, away["team"], +2, "Away winning; home losing")
         return 0, +2
 
     # Both winning => slight home edge
     if home_winning and away_winning:
-        _add_edge(breakdown, "home_away", home["team"], +1, "Both winning splits; home slight edge")
+        _add_edge(breakdown, _F_HOME_AWAY, home["team"], +1, "Both winning splits; home slight edge")
         return +1, 0
 
     # Both losing => slight home edge (your explanation)
     if (not home_winning) and (not away_winning):
-        _add_edge(breakdown, "home_away", home["team"], +1, "Both losing splits; home slight edge")
+        _add_edge(breakdown, _F_HOME_AWAY, home["team"], +1, "Both losing splits; home slight edge")
         return +1, 0
 
-    _add_edge(breakdown, "home_away", None, 0, "No meaningful split edge")
+    _add_shared(breakdown, _N_HA_NEUTRAL)
     return 0, 0
 
-def injuries_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[EdgeBreakdown]) -> Tuple[int, int]:
+def injuries_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[Edge] | None) -> Tuple[int, int]:
     # Only penalize for confirmed OUT players (you’ll enforce that in data layer)
     h_top15 = int(home.get("out_top15_scorers") or 0)
     a_top15 = int(away.get("out_top15_scorers") or 0)
@@ -61,80 +107,86 @@ def injuries_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[Ed
     as_ = 0
     if h_top15 > 0:
         hs -= 5
-        _add_edge(breakdown, "injuries", home["team"], -5, f"Missing top-15 scorer(s): {h_top15}")
+        _add_edge(breakdown, _F_INJURIES, home["team"], -5, _reason_top15(h_top15))
     elif h_top50 > 0:
         hs -= 3
-        _add_edge(breakdown, "injuries", home["team"], -3, f"Missing top-50 scorer(s): {h_top50}")
+        _add_edge(breakdown, _F_INJURIES, home["team"], -3, _reason_top50(h_top50))
 
     if a_top15 > 0:
         as_ -= 5
-        _add_edge(breakdown, "injuries", away["team"], -5, f"Missing top-15 scorer(s): {a_top15}")
+        _add_edge(breakdown, _F_INJURIES, away["team"], -5, _reason_top15(a_top15))
     elif a_top50 > 0:
         as_ -= 3
-        _add_edge(breakdown, "injuries", away["team"], -3, f"Missing top-50 scorer(s): {a_top50}")
+        _add_edge(breakdown, _F_INJURIES, away["team"], -3, _reason_top50(a_top50))
 
     if hs == 0 and as_ == 0:
-        _add_edge(breakdown, "injuries", None, 0, "No significant scoring injuries")
+        _add_shared(breakdown, _N_INJ_NONE)
     return hs, as_
 
-def goals_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[EdgeBreakdown]) -> Tuple[int, int]:
+def goals_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[Edge] | None) -> Tuple[int, int]:
     hgfr = home.get("goals_for_rank")
     hgaw = home.get("goals_against_rank")
     agfr = away.get("goals_for_rank")
     agaw = away.get("goals_against_rank")
 
-    if None in (hgfr, hgaw, agfr, agaw):
-        _add_edge(breakdown, "goals_balance", None, 0, "Missing goals rank data")
+    # is-None chain short-circuits and avoids building a tuple per call
+    if hgfr is None or hgaw is None or agfr is None or agaw is None:
+        _add_shared(breakdown, _N_GOALS_MISSING)
         return 0, 0
 
-    def elite(gfr, gaw) -> bool:
-        return (gfr <= 15) and (gaw <= 15)
-
-    def poor(gfr, gaw) -> bool:
-        return (gfr >= 18) and (gaw >= 18)  # bottom ~15 in a 32-team league
-
-    home_elite = elite(hgfr, hgaw)
-    away_elite = elite(agfr, agaw)
-    home_poor = poor(hgfr, hgaw)
-    away_poor = poor(agfr, agaw)
+    # "poor" = bottom ~15 in a 32-team league
+    home_elite = (hgfr <= 15) and (hgaw <= 15)
+    away_elite = (agfr <= 15) and (agaw <= 15)
+    home_poor = (hgfr >= 18) and (hgaw >= 18)
+    away_poor = (agfr >= 18) and (agaw >= 18)
 
     if home_elite and not away_elite:
-        _add_edge(breakdown, "goals_balance", home["team"], +2, "Top-15 goals for AND top-15 goals against")
+        _add_edge(breakdown, _F_GOALS, home["team"], +2, "Top-15 goals for AND top-15 goals against")
         return +2, 0
     if away_elite and not home_elite:
-        _add_edge(breakdown, "goals_balance", away["team"], +2, "Top-15 goals for AND top-15 goals against")
+        _add_edge(breakdown, _F_GOALS, away["team"], +2, "Top-15 goals for AND top-15 goals against")
         return 0, +2
 
     if home_poor and not away_poor:
-        _add_edge(breakdown, "goals_balance", home["team"], -2, "Bottom-15 goals for AND bottom-15 goals against")
+        _add_edge(breakdown, _F_GOALS, home["team"], -2, "Bottom-15 goals for AND bottom-15 goals against")
         return -2, 0
     if away_poor and not home_poor:
-        _add_edge(breakdown, "goals_balance", away["team"], -2, "Bottom-15 goals for AND bottom-15 goals against")
+        _add_edge(breakdown, _F_GOALS, away["team"], -2, "Bottom-15 goals for AND bottom-15 goals against")
         return 0, -2
 
-    _add_edge(breakdown, "goals_balance", None, 0, "No clear goals balance edge")
+    _add_shared(breakdown, _N_GOALS_NEUTRAL)
     return 0, 0
 
-def form_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[EdgeBreakdown]) -> Tuple[int, int]:
+# streak_type normalized at ingestion: W=+1, L=-1, none=0; out-of-range
+# values mean an unrecognized code and disable the rule for that team.
+_STREAK_MAP = {"W": 1, "L": -1, None: 0}
+_STREAK_INVALID = 99
+
+
+def streak_int(team: Dict[str, Any]) -> int:
+    si = team.get("streak_int")
+    if isinstance(si, int):
+        return si
+    return _STREAK_MAP.get(team.get("streak_type"), _STREAK_INVALID)
+
+
+def form_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[Edge] | None) -> Tuple[int, int]:
     def edge(team: Dict[str, Any]) -> int:
         last10 = team.get("last10_points_pct")
-        stype = team.get("streak_type")
-        if last10 is None or stype not in ("W", "L", None):
+        si = streak_int(team)
+        if last10 is None or si < -1 or si > 1:
             return 0
 
-        above = last10 > 0.5
-        below = last10 < 0.5
-        streak_w = stype == "W"
-        streak_l = stype == "L"
-
-        if above and streak_w:
-            return +2
-        if above and streak_l:
-            return -2
-        if below and streak_l:
-            return -2
-        if below and streak_w:
-            return +1  # your "slight edge"
+        if last10 > 0.5:
+            if si == 1:
+                return +2
+            if si == -1:
+                return -2
+        elif last10 < 0.5:
+            if si == -1:
+                return -2
+            if si == 1:
+                return +1  # your "slight edge"
         return 0
 
     hs = edge(home)
@@ -142,18 +194,18 @@ def form_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[EdgeBr
 
     # If both equal, call it neutral in explanation
     if hs == as_:
-        _add_edge(breakdown, "form", None, 0, "Form factors offset or equal")
+        _add_shared(breakdown, _N_FORM_OFFSET)
         return 0, 0
 
     if hs != 0:
-        _add_edge(breakdown, "form", home["team"], hs, "Last 10 + streak effect")
+        _add_edge(breakdown, _F_FORM, home["team"], hs, "Last 10 + streak effect")
     if as_ != 0:
-        _add_edge(breakdown, "form", away["team"], as_, "Last 10 + streak effect")
+        _add_edge(breakdown, _F_FORM, away["team"], as_, "Last 10 + streak effect")
     return hs, as_
 
-def head_to_head_edge(h2h: Dict[str, Any] | None, home_team: str, away_team: str, breakdown: List[EdgeBreakdown]) -> Tuple[int, int]:
+def head_to_head_edge(h2h: Dict[str, Any] | None, home_team: str, away_team: str, breakdown: List[Edge] | None) -> Tuple[int, int]:
     if not h2h:
-        _add_edge(breakdown, "h2h_recent", None, 0, "No head-to-head data available")
+        _add_shared(breakdown, _N_H2H_NONE)
         return 0, 0
 
     home_wins = h2h.get("home_wins")
@@ -161,7 +213,7 @@ def head_to_head_edge(h2h: Dict[str, Any] | None, home_team: str, away_team: str
     games_found = int(h2h.get("games_found") or 0)
 
     if home_wins is None or away_wins is None or games_found <= 0:
-        _add_edge(breakdown, "h2h_recent", None, 0, "Incomplete head-to-head data")
+        _add_shared(breakdown, _N_H2H_INCOMPLETE)
         return 0, 0
 
     # Scale points by sample size
@@ -175,28 +227,28 @@ def head_to_head_edge(h2h: Dict[str, Any] | None, home_team: str, away_team: str
         pts = 0
 
     if pts == 0 or home_wins == away_wins:
-        _add_edge(breakdown, "h2h_recent", None, 0, f"Even/too-small H2H sample (n={games_found})")
+        _add_edge(breakdown, _F_H2H, None, 0, f"Even/too-small H2H sample (n={games_found})")
         return 0, 0
 
     if home_wins > away_wins:
-        _add_edge(breakdown, "h2h_recent", home_team, pts, f"Better H2H in last {games_found} games")
+        _add_edge(breakdown, _F_H2H, home_team, pts, f"Better H2H in last {games_found} games")
         return pts, 0
 
-    _add_edge(breakdown, "h2h_recent", away_team, pts, f"Better H2H in last {games_found} games")
+    _add_edge(breakdown, _F_H2H, away_team, pts, f"Better H2H in last {games_found} games")
     return 0, pts
 
 
-def goalie_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[EdgeBreakdown]) -> Tuple[int, int]:
+def goalie_edge(home: Dict[str, Any], away: Dict[str, Any], breakdown: List[Edge] | None) -> Tuple[int, int]:
     h = int(home.get("goalie_factor") or 0)
     a = int(away.get("goalie_factor") or 0)
 
     if h == a:
-        _add_edge(breakdown, "goalie", None, 0, "Equal team goalie factor")
+        _add_shared(breakdown, _N_GOALIE_EQUAL)
         return 0, 0
 
     if h > a:
-        _add_edge(breakdown, "goalie", home["team"], h - a, "Stronger team goalie (by SV% & usage)")
+        _add_edge(breakdown, _F_GOALIE, home["team"], h - a, "Stronger team goalie (by SV% & usage)")
         return h - a, 0
     else:
-        _add_edge(breakdown, "goalie", away["team"], a - h, "Stronger team goalie (by SV% & usage)")
+        _add_edge(breakdown, _F_GOALIE, away["team"], a - h, "Stronger team goalie (by SV% & usage)")
         return 0, a - h
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, frozen=True)
+class Edge:
+    """
+    Internal breakdown row. Same shape as the EdgeBreakdown response
+    model, but a plain slotted dataclass so hot-path construction skips
+    Pydantic validation; it's converted to EdgeBreakdown only when the
+    API response is assembled. Frozen so the common neutral rows can be
+    shared module-wide without cross-request contamination.
+    """
+    factor: str
+    team: Optional[str]
+    points: int
+    reason: str
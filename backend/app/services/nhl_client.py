@@ -1,18 +1,61 @@
 import httpx
 import asyncio
+import bisect
+import json
+import orjson
+import os
+import time
 from datetime import date as dt_date
-from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from app.config import settings
 
+try:
+    import numpy as np
+except ImportError:  # optional; rank computation falls back to sorted()
+    np = None
+
+
+class _TokenBucket:
+    """
+    Minimal asyncio token bucket: ``rate`` tokens per second with bursts up
+    to ``capacity``. The semaphore bounds how many requests are in flight
+    at once; this bounds how fast they are issued, so pooling + HTTP/2
+    can't burst hard enough to trip NHL API rate limits.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            wait = (1.0 - self._tokens) / self._rate
+            self._tokens = 0.0
+            self._updated += wait
+        await asyncio.sleep(wait)
+
 
 def _get_nested(d: Dict[str, Any], path: List[str], default=None):
+    # EAFP: plain C-level subscripts on the happy path; a wrong shape or
+    # missing key raises and yields the default
     cur: Any = d
-    for p in path:
-        if not isinstance(cur, dict) or p not in cur:
-            return default
-        cur = cur[p]
-    return cur
+    try:
+        for p in path:
+            cur = cur[p]
+        return cur
+    except (KeyError, TypeError, IndexError):
+        return default
 
 
 def _points_pct(w: int, l: int, otl: int) -> Optional[float]:
@@ -24,6 +67,20 @@ def _points_pct(w: int, l: int, otl: int) -> Optional[float]:
     return pts / max_pts if max_pts else None
 
 
+# Integer streak code so scoring compares ints instead of strings:
+# W=+1, L=-1, no streak=0; anything else (e.g. "OT") gets an out-of-range
+# code the form rule treats as invalid.
+_STREAK_MAP = {"W": 1, "L": -1, None: 0}
+_STREAK_INVALID = 99
+
+# canonical streak codes: dict hit replaces a str.upper() call per row
+_STREAK_CODES = {"W": "W", "L": "L", "OT": "OT", "w": "W", "l": "L", "ot": "OT"}
+
+# goalie SV% buckets: score i applies from _GOALIE_THRESHOLDS[i-1] upward
+_GOALIE_THRESHOLDS = (0.890, 0.900, 0.910, 0.920)
+_GOALIE_SCORES = (-2, -1, 0, 1, 2)
+
+
 def _parse_streak(team_row: Dict[str, Any]) -> Tuple[Optional[str], int]:
     """
     Best-effort, because NHL API fields vary:
@@ -34,11 +91,11 @@ def _parse_streak(team_row: Dict[str, Any]) -> Tuple[Optional[str], int]:
     count = team_row.get("streakCount")
 
     if isinstance(code, str) and isinstance(count, int):
-        return code.upper(), count
+        return _STREAK_CODES.get(code) or code.upper(), count
 
     streak = team_row.get("streak")
     if isinstance(streak, str) and len(streak) >= 2:
-        c = streak[0].upper()
+        c = _STREAK_CODES.get(streak[0]) or streak[0].upper()
         try:
             n = int(streak[1:])
             return c, n
@@ -60,33 +117,78 @@ class NHLClient:
         self.base = settings.nhl_api_base.rstrip("/")
         self._timeout = 20.0
 
+        # bound total in-flight requests no matter how wide callers fan out;
+        # with HTTP/2 multiplexing these mostly share a socket, so a wider
+        # bound costs no extra connections
+        self._sem = asyncio.Semaphore(20)
+
+        # issue-rate cap on top of the concurrency cap (see _TokenBucket)
+        self._bucket = _TokenBucket(rate=10.0, capacity=10.0)
+
+        # One long-lived connection pool for the process: keep-alive spares
+        # us a TCP+TLS handshake per request. Closed via aclose() on app
+        # shutdown. Headers live on the client so _get_json doesn't rebuild
+        # the dict per call. HTTP/2 lets the 32-team club-stats fan-out
+        # multiplex over one connection instead of queueing on the pool.
+        self._client = httpx.AsyncClient(
+            timeout=self._timeout,
+            http2=True,
+            follow_redirects=True,
+            headers={
+                "User-Agent": "hockey-odds-calculator/1.0",
+                "Accept": "application/json",
+            },
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+
         # tiny per-process cache (so one /today call doesn’t re-fetch standings 20 times)
         self._standings_cache_date: Optional[str] = None
         self._standings_cache: Optional[List[Dict[str, Any]]] = None
 
-        # computed goal ranks cache
-        self._goal_rank_cache: Optional[Dict[str, Dict[str, int]]] = None
+        # Generation counter for standings-derived caches: bumped on every
+        # standings replace. Derived caches record the rev they were built
+        # from and recompute on mismatch, so a mid-day standings refresh
+        # can never leave them silently stale.
+        self._standings_rev = 0
 
-        # Team goalie factor cache (by team abbrev)
-        self._team_goalie_factor_cache_date: Optional[str] = None
-        self._team_goalie_factor_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        # computed goal ranks cache: (standings_rev, ranks)
+        self._goal_rank_cache: Optional[Tuple[int, Dict[str, Dict[str, int]]]] = None
 
+        # abbrev → standings row index: (standings_rev, index)
+        self._standings_by_abbrev: Optional[Tuple[int, Dict[str, Dict[str, Any]]]] = None
 
+        # abbrev → the four points% splits: (standings_rev, pcts)
+        self._pct_by_abbrev: Optional[Tuple[int, Dict[str, Dict[str, Optional[float]]]]] = None
+
+        # Team goalie factor cache (by team abbrev): (date, standings_rev, data)
+        self._team_goalie_factor_cache: Optional[Tuple[str, int, Dict[str, Dict[str, Any]]]] = None
+
+        # Per-day snapshot memo. Futures (not results) are stored so
+        # concurrent callers for the same team await one computation
+        # instead of racing to build it twice.
+        self._snapshot_cache_date: Optional[str] = None
+        self._snapshot_cache: Dict[str, asyncio.Future] = {}
+
+        # Per-day head-to-head memo, symmetric key: the pair (A, B) hits the
+        # same entry regardless of which side is home. Same future-sharing
+        # scheme as the snapshot cache.
+        self._h2h_cache_date: Optional[str] = None
+        self._h2h_cache: Dict[frozenset, asyncio.Future] = {}
+
+    async def aclose(self):
+        await self._client.aclose()
 
     async def _get_json(self, url: str):
         try:
-            async with httpx.AsyncClient(timeout=self._timeout, follow_redirects=True) as client:
-                r = await client.get(
-                    url,
-                    headers={
-                        "User-Agent": "hockey-odds-calculator/1.0",
-                        "Accept": "application/json",
-                    },
-                )
-                if r.status_code != 200:
-                    # keep it quiet in normal operation; return None gracefully
-                    return None
-                return r.json()
+            async with self._sem:
+                await self._bucket.acquire()
+                r = await self._client.get(url)
+            if r.status_code != 200:
+                # keep it quiet in normal operation; return None gracefully
+                return None
+            # orjson parses the larger payloads (club-schedule-season runs
+            # to megabytes) several times faster than Response.json()
+            return orjson.loads(r.content)
         except Exception:
             return None
 
@@ -161,22 +263,103 @@ class NHLClient:
         self._standings_cache_date = date_str
         self._standings_cache = standings
 
-        # standings changed → invalidate goal ranks cache
-        self._goal_rank_cache = None
+        # standings changed → derived caches built from an older rev recompute
+        self._standings_rev += 1
 
         return standings
 
     def _extract_abbrev(self, row: Dict[str, Any]) -> Optional[str]:
-        v = row.get("teamAbbrev")
-        if isinstance(v, str):
-            return v
-        if isinstance(v, dict):
-            d = v.get("default")
+        # EAFP fast path: the common shape is {"teamAbbrev": {"default": "TOR"}},
+        # which resolves in two subscripts; a bare string raises TypeError,
+        # a missing key raises KeyError, and both fall back below.
+        try:
+            d = row["teamAbbrev"]["default"]
             if isinstance(d, str):
                 return d
+        except TypeError:
+            v = row.get("teamAbbrev")
+            if isinstance(v, str):
+                return v
+        except KeyError:
+            pass
         tri = row.get("teamTriCode") or row.get("triCode")
         return tri if isinstance(tri, str) else None
 
+    def _standings_index(self, standings: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        cached = self._standings_by_abbrev
+        if cached is not None and cached[0] == self._standings_rev:
+            return cached[1]
+
+        index: Dict[str, Dict[str, Any]] = {}
+        for r in standings:
+            ab = self._extract_abbrev(r)
+            if ab:
+                index[ab.upper()] = r
+
+        self._standings_by_abbrev = (self._standings_rev, index)
+        return index
+
+    def _pct_index(self, standings: List[Dict[str, Any]]) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        All four points% splits (overall, home, away, last 10) for every
+        team, computed in one vectorized pass per standings revision
+        instead of four scalar _points_pct calls per snapshot build.
+        """
+        cached = self._pct_by_abbrev
+        if cached is not None and cached[0] == self._standings_rev:
+            return cached[1]
+
+        index = self._standings_index(standings)
+        abbrevs = list(index.keys())
+        rows = [index[ab] for ab in abbrevs]
+
+        def _col(*keys: str) -> List[int]:
+            out = []
+            for r in rows:
+                v = 0
+                for k in keys:
+                    v = r.get(k)
+                    if v:
+                        break
+                out.append(int(v or 0))
+            return out
+
+        cols = {
+            "points_pct": (_col("wins"), _col("losses"), _col("otLosses")),
+            "home_points_pct": (_col("homeWins"), _col("homeLosses"), _col("homeOtLosses")),
+            "away_points_pct": (
+                _col("roadWins", "awayWins"),
+                _col("roadLosses", "awayLosses"),
+                _col("roadOtLosses", "awayOtLosses"),
+            ),
+            "last10_points_pct": (_col("l10Wins"), _col("l10Losses"), _col("l10OtLosses")),
+        }
+
+        pcts: Dict[str, List[Optional[float]]] = {}
+        if np is not None:
+            for name, (w, l, otl) in cols.items():
+                w_a = np.asarray(w, dtype=np.float64)
+                l_a = np.asarray(l, dtype=np.float64)
+                otl_a = np.asarray(otl, dtype=np.float64)
+                games = w_a + l_a + otl_a
+                vals = np.divide(2.0 * w_a + otl_a, 2.0 * games, out=np.full_like(games, np.nan), where=games > 0)
+                pcts[name] = [None if v != v else float(v) for v in vals]
+        else:
+            for name, (w, l, otl) in cols.items():
+                pcts[name] = [_points_pct(w[i], l[i], otl[i]) for i in range(len(rows))]
+
+        out: Dict[str, Dict[str, Optional[float]]] = {}
+        for i, ab in enumerate(abbrevs):
+            entry = {name: pcts[name][i] for name in cols}
+            # league-provided overall pct wins over the derived one
+            p = rows[i].get("pointPctg")
+            if isinstance(p, (int, float)):
+                entry["points_pct"] = float(p)
+            out[ab] = entry
+
+        self._pct_by_abbrev = (self._standings_rev, out)
+        return out
+
     def _compute_goal_ranks(self, standings: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
         rows: List[Tuple[str, float, float]] = []
 
@@ -192,11 +375,20 @@ class NHLClient:
         if not rows:
             return {}
 
-        gf_sorted = sorted(rows, key=lambda x: x[1], reverse=True)
-        gf_rank = {ab: i + 1 for i, (ab, _, __) in enumerate(gf_sorted)}
+        if np is not None:
+            # SoA + argsort: no tuple materialization or key-lambda dispatch.
+            # Stable sorts keep tie order identical to the sorted() fallback.
+            abbrevs = [ab for ab, _, __ in rows]
+            gf_arr = np.fromiter((gf for _, gf, __ in rows), dtype=np.float32, count=len(rows))
+            ga_arr = np.fromiter((ga for _, __, ga in rows), dtype=np.float32, count=len(rows))
+            gf_rank = {abbrevs[j]: i + 1 for i, j in enumerate(np.argsort(-gf_arr, kind="stable"))}
+            ga_rank = {abbrevs[j]: i + 1 for i, j in enumerate(np.argsort(ga_arr, kind="stable"))}
+        else:
+            gf_sorted = sorted(rows, key=lambda x: x[1], reverse=True)
+            gf_rank = {ab: i + 1 for i, (ab, _, __) in enumerate(gf_sorted)}
 
-        ga_sorted = sorted(rows, key=lambda x: x[2])
-        ga_rank = {ab: i + 1 for i, (ab, _, __) in enumerate(ga_sorted)}
+            ga_sorted = sorted(rows, key=lambda x: x[2])
+            ga_rank = {ab: i + 1 for i, (ab, _, __) in enumerate(ga_sorted)}
 
         out: Dict[str, Dict[str, int]] = {}
         for ab, _, __ in rows:
@@ -207,6 +399,40 @@ class NHLClient:
         return out
 
     async def get_team_snapshot(self, team_abbrev: str, game_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Memoized per (team, day): a team showing up as home in one game and
+        away in another builds its snapshot once, and concurrent callers
+        share the in-flight future. game_id doesn't affect the snapshot, so
+        it isn't part of the key.
+        """
+        today = dt_date.today().isoformat()
+        if self._snapshot_cache_date != today:
+            self._snapshot_cache_date = today
+            self._snapshot_cache = {}
+
+        key = team_abbrev.upper()
+        fut = self._snapshot_cache.get(key)
+        if fut is not None:
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._snapshot_cache[key] = fut
+        try:
+            snap = await self._build_team_snapshot(team_abbrev, game_id)
+        except BaseException as exc:
+            self._snapshot_cache.pop(key, None)
+            fut.set_exception(exc)
+            fut.exception()  # mark retrieved even if no one is waiting
+            raise
+        fut.set_result(snap)
+        # A failed standings fetch surfaces as a normal all-default snapshot
+        # (_get_json swallows errors), not an exception — don't pin that for
+        # the day; drop the entry so the next call retries the fetch.
+        if not (self._standings_cache_date == today and self._standings_cache):
+            self._snapshot_cache.pop(key, None)
+        return snap
+
+    async def _build_team_snapshot(self, team_abbrev: str, game_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Build the full dict needed for scoring from standings.
         Goalie (v1): use DailyFaceoff projected/confirmed starter status, then match to NHL top10 SV% by name.
@@ -223,6 +449,7 @@ class NHLClient:
             "goals_against_rank": None,
             "last10_points_pct": None,
             "streak_type": None,
+            "streak_int": 0,
             "streak_len": 0,
             "out_top50_scorers": 0,
             "out_top15_scorers": 0,
@@ -239,54 +466,33 @@ class NHLClient:
         if not standings:
             return snap
 
-        # Find team row
-        team_row = None
-        for r in standings:
-            ab = self._extract_abbrev(r)
-            if ab and ab.upper() == team_abbrev.upper():
-                team_row = r
-                break
+        # Find team row via the per-revision abbrev index (no linear scan)
+        team_row = self._standings_index(standings).get(team_abbrev.upper())
 
         if not team_row:
             return snap
 
-        # points pct
-        p = team_row.get("pointPctg")
-        if isinstance(p, (int, float)):
-            snap["points_pct"] = float(p)
-        else:
-            w = int(team_row.get("wins") or 0)
-            l = int(team_row.get("losses") or 0)
-            otl = int(team_row.get("otLosses") or 0)
-            snap["points_pct"] = _points_pct(w, l, otl)
-
-        # home/away points pct
-        hw = int(team_row.get("homeWins") or 0)
-        hl = int(team_row.get("homeLosses") or 0)
-        hotl = int(team_row.get("homeOtLosses") or 0)
-        aw = int(team_row.get("roadWins") or team_row.get("awayWins") or 0)
-        al = int(team_row.get("roadLosses") or team_row.get("awayLosses") or 0)
-        aotl = int(team_row.get("roadOtLosses") or team_row.get("awayOtLosses") or 0)
-
-        snap["home_points_pct"] = _points_pct(hw, hl, hotl)
-        snap["away_points_pct"] = _points_pct(aw, al, aotl)
-
-        # last 10
-        l10w = int(team_row.get("l10Wins") or 0)
-        l10l = int(team_row.get("l10Losses") or 0)
-        l10otl = int(team_row.get("l10OtLosses") or 0)
-        snap["last10_points_pct"] = _points_pct(l10w, l10l, l10otl)
+        # points% splits, precomputed for the whole league per revision
+        pcts = self._pct_index(standings).get(team_abbrev.upper())
+        if pcts:
+            snap["points_pct"] = pcts["points_pct"]
+            snap["home_points_pct"] = pcts["home_points_pct"]
+            snap["away_points_pct"] = pcts["away_points_pct"]
+            snap["last10_points_pct"] = pcts["last10_points_pct"]
 
         # streak
         stype, slen = _parse_streak(team_row)
         snap["streak_type"] = stype
+        snap["streak_int"] = _STREAK_MAP.get(stype, _STREAK_INVALID)
         snap["streak_len"] = slen
 
-        # goals ranks cached
-        if self._goal_rank_cache is None:
-            self._goal_rank_cache = self._compute_goal_ranks(standings)
+        # goals ranks cached per standings revision
+        cached = self._goal_rank_cache
+        if cached is None or cached[0] != self._standings_rev:
+            cached = (self._standings_rev, self._compute_goal_ranks(standings))
+            self._goal_rank_cache = cached
 
-        ranks = self._goal_rank_cache.get(team_abbrev.upper(), {})
+        ranks = cached[1].get(team_abbrev.upper(), {})
         snap["goals_for_rank"] = ranks.get("goals_for_rank")
         snap["goals_against_rank"] = ranks.get("goals_against_rank")
 
@@ -309,9 +515,66 @@ class NHLClient:
         n: int = 5,
         max_seasons_back: int = 5,
     ) -> Optional[Dict[str, Any]]:
+        """
+        Memoized per (team pair, day) with a symmetric key, so the result is
+        shared however home/away fall and concurrent callers await one scan.
+        """
+        today = dt_date.today().isoformat()
+        if self._h2h_cache_date != today:
+            self._h2h_cache_date = today
+            self._h2h_cache = {}
+
+        key = frozenset({home_team.upper(), away_team.upper()})
+        fut = self._h2h_cache.get(key)
+        if fut is not None:
+            cached = await asyncio.shield(fut)
+            return self._orient_h2h(cached, home_team)
+
+        fut = asyncio.get_running_loop().create_future()
+        self._h2h_cache[key] = fut
+        try:
+            result, fetched_ok = await self._fetch_head_to_head_lastN(home_team, away_team, n, max_seasons_back)
+        except BaseException as exc:
+            self._h2h_cache.pop(key, None)
+            fut.set_exception(exc)
+            fut.exception()  # mark retrieved even if no one is waiting
+            raise
+        # store in a fixed orientation (keyed by the fetching call's home)
+        fut.set_result(None if result is None else {**result, "home_team": home_team.upper()})
+        if result is None and not fetched_ok:
+            # every season fetch failed — that's an API outage, not a
+            # genuinely empty scan; don't pin None for the day
+            self._h2h_cache.pop(key, None)
+        return result
+
+    @staticmethod
+    def _orient_h2h(cached: Optional[Dict[str, Any]], home_team: str) -> Optional[Dict[str, Any]]:
+        if cached is None:
+            return None
+        if cached.get("home_team") == home_team.upper():
+            return {
+                "home_wins": cached["home_wins"],
+                "away_wins": cached["away_wins"],
+                "games_found": cached["games_found"],
+            }
+        return {
+            "home_wins": cached["away_wins"],
+            "away_wins": cached["home_wins"],
+            "games_found": cached["games_found"],
+        }
+
+    async def _fetch_head_to_head_lastN(
+        self,
+        home_team: str,
+        away_team: str,
+        n: int = 5,
+        max_seasons_back: int = 5,
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
         """
         Find up to last N head-to-head games between home_team and away_team
-        across seasons using club-schedule-season.
+        across seasons using club-schedule-season. The second element says
+        whether any season fetch actually succeeded, so the caller can tell
+        an empty history apart from an API outage.
         """
 
         def _season_ids_back(start_season: str, count: int) -> List[str]:
@@ -324,16 +587,25 @@ class NHLClient:
 
         seasons = _season_ids_back(base_season, max_seasons_back)
 
+        h_up = home_team.upper()
+        a_up = away_team.upper()
+
+        # All seasons fetched in one overlap instead of serially; a few
+        # responses may go unused when recent seasons already cover n games,
+        # but they cost one RTT total instead of one each. The client-wide
+        # semaphore in _get_json bounds the burst.
+        urls = [f"{self.base}/club-schedule-season/{h_up}/{season}" for season in seasons]
+        datas = await asyncio.gather(*(self._get_json(u) for u in urls))
+        fetched_ok = any(isinstance(d, dict) for d in datas)
+
         home_wins = 0
         away_wins = 0
         found = 0
 
-        for season in seasons:
+        for data in datas:  # newest season first
             if found >= n:
                 break
 
-            url = f"{self.base}/club-schedule-season/{home_team.upper()}/{season}"
-            data = await self._get_json(url)
             if not isinstance(data, dict):
                 continue
 
@@ -354,8 +626,9 @@ class NHLClient:
                 h_ab = home.get("abbrev")
                 a_ab = away.get("abbrev")
 
-                # must be a matchup between these two teams
-                if {h_ab, a_ab} != {home_team.upper(), away_team.upper()}:
+                # must be a matchup between these two teams; plain equality
+                # checks avoid allocating a set per game in this loop
+                if not ((h_ab == h_up and a_ab == a_up) or (h_ab == a_up and a_ab == h_up)):
                     continue
 
                 h_score = home.get("score")
@@ -371,7 +644,7 @@ class NHLClient:
                     found += 1
                     continue
 
-                if winner == home_team.upper():
+                if winner == h_up:
                     home_wins += 1
                 else:
                     away_wins += 1
@@ -379,13 +652,13 @@ class NHLClient:
                 found += 1
 
         if found == 0:
-            return None
+            return None, fetched_ok
 
         return {
             "home_wins": home_wins,
             "away_wins": away_wins,
             "games_found": found,
-        }
+        }, fetched_ok
 
     def _goalie_bucket_score(self, sv_pct: Optional[float]) -> int:
         """
@@ -395,20 +668,13 @@ class NHLClient:
         .900-.909 => 0
         .890-.899 => -1
         < .890 => -2
+
+        One C-level binary search over the thresholds instead of a chain
+        of Python-level compares.
         """
         if not isinstance(sv_pct, (int, float)):
             return 0
-
-        v = float(sv_pct)
-        if v >= 0.920:
-            return 2
-        if v >= 0.910:
-            return 1
-        if v >= 0.900:
-            return 0
-        if v >= 0.890:
-            return -1
-        return -2
+        return _GOALIE_SCORES[bisect.bisect_right(_GOALIE_THRESHOLDS, float(sv_pct))]
 
     def _current_season_id(self) -> str:
         """
@@ -426,7 +692,7 @@ class NHLClient:
         return f"{start}{end}"
 
 
-    async def _build_team_goalie_factor_map(self) -> Dict[str, Dict[str, Any]]:
+    async def _build_team_goalie_factor_map(self, only: Optional[Set[str]] = None) -> Dict[str, Dict[str, Any]]:
         """
         Build goalie factor per team using club-stats:
         - pick goalie with most GP
@@ -438,36 +704,49 @@ class NHLClient:
             .900-.909 => 0
             .890-.899 => -1
             < .890 => -2
+
+        With ``only`` the fan-out is limited to those teams; on a typical
+        night that's 10-16 clubs instead of all 32. The cache holds partial
+        fills, so teams requested later are fetched on demand and merged.
         """
         today = dt_date.today().isoformat()
-        if self._team_goalie_factor_cache_date == today and isinstance(self._team_goalie_factor_cache, dict):
-            return self._team_goalie_factor_cache
 
         season = getattr(settings, "nhl_season", None) or self._current_season_id()
         game_type = 2  # regular season
 
         standings = await self._get_standings(today)
         if not standings:
-            self._team_goalie_factor_cache_date = today
-            self._team_goalie_factor_cache = {}
             return {}
 
-        team_abbrevs: List[str] = []
-        for r in standings:
-            ab = self._extract_abbrev(r)
-            if isinstance(ab, str) and ab.strip():
-                team_abbrevs.append(ab.strip().upper())
-        team_abbrevs = sorted(set(team_abbrevs))
+        cached = self._team_goalie_factor_cache
+        if cached is not None and cached[0] == today and cached[1] == self._standings_rev:
+            data = cached[2]
+        else:
+            # L2: best-effort disk cache so a process restart inside the same
+            # day doesn't re-fetch the club-stats pages already pulled
+            data = self._load_goalie_disk_cache(season, today) or {}
+            self._team_goalie_factor_cache = (today, self._standings_rev, data)
+
+        if only is None:
+            # abbrev list comes straight from the per-revision standings index
+            targets = sorted(self._standings_index(standings).keys())
+        else:
+            targets = sorted({t.upper() for t in only})
 
-        sem = asyncio.Semaphore(8)
+        missing = [t for t in targets if t not in data]
+        if not missing:
+            return data
 
-        async def fetch_team(team: str) -> Tuple[str, Dict[str, Any]]:
+        async def fetch_team(team: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+            # concurrency is bounded by the client-wide semaphore in
+            # _get_json; a second local semaphore here would just double-gate
             url = f"{self.base}/club-stats/{team}/{season}/{game_type}"
-            async with sem:
-                data = await self._get_json(url)
+            data = await self._get_json(url)
 
             if not isinstance(data, dict):
-                return team, {"score": 0, "sv_pct": None, "gp": 0, "used_split": False}
+                # fetch failed — report None so the team isn't cached as a
+                # zero-score placeholder and gets retried on the next build
+                return team, None
 
             goalies = data.get("goalies")
             if not isinstance(goalies, list) or not goalies:
@@ -510,12 +789,33 @@ class NHLClient:
             score = self._goalie_bucket_score(used_sv)
             return team, {"score": score, "sv_pct": used_sv, "gp": top_gp, "used_split": used_split}
 
-        results = await asyncio.gather(*(fetch_team(t) for t in team_abbrevs))
-        out = {team: payload for team, payload in results}
+        results = await asyncio.gather(*(fetch_team(t) for t in missing))
+        data.update((team, payload) for team, payload in results if payload is not None)
 
-        self._team_goalie_factor_cache_date = today
-        self._team_goalie_factor_cache = out
-        return out
+        self._store_goalie_disk_cache(season, today, data)
+        return data
+
+    @staticmethod
+    def _goalie_disk_cache_path(season: str, date_str: str) -> Path:
+        # per-user cache dir, not a predictable world-writable /tmp name
+        # that another local user could pre-plant
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        return base / "hockey-odds-calculator" / f"nhl_goalie_{season}_{date_str}.json"
+
+    def _load_goalie_disk_cache(self, season: str, date_str: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        try:
+            data = json.loads(self._goalie_disk_cache_path(season, date_str).read_text())
+            return data if isinstance(data, dict) else None
+        except Exception:
+            return None
+
+    def _store_goalie_disk_cache(self, season: str, date_str: str, data: Dict[str, Dict[str, Any]]):
+        try:
+            path = self._goalie_disk_cache_path(season, date_str)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data))
+        except Exception:
+            pass
 
 
 
@@ -523,6 +823,7 @@ class NHLClient:
     async def get_team_goalie_factor(self, team_abbrev: str) -> Dict[str, Any]:
         """
         Public helper: returns goalie factor dict for a team abbrev.
+        Fetches just that team on a cache miss rather than the full league.
         """
-        m = await self._build_team_goalie_factor_map()
+        m = await self._build_team_goalie_factor_map(only={team_abbrev})
         return m.get(team_abbrev.upper(), {"score": 0, "sv_pct": None, "gp": 0, "used_split": False})
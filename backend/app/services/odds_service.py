@@ -1,7 +1,21 @@
+import asyncio
+from dataclasses import asdict
 from typing import Any, Dict, List
 
-from app.models import TodayResponse, MatchupResult, MatchupScore, MatchupProb
-from app.scoring.engine import score_matchup
+from app.models import EdgeBreakdown, TodayResponse, MatchupResult, MatchupScore, MatchupProb
+from app.scoring.engine import score_matchup_fused
+
+try:
+    from app.scoring.engine_vec import score_all
+except ImportError:  # numpy not installed; fall back to per-game scoring
+    score_all = None
+
+try:
+    from app.scoring.kernel import NUMBA_AVAILABLE, score_batch, team_features
+except ImportError:
+    NUMBA_AVAILABLE = False
+    score_batch = None
+    team_features = None
 
 
 def _default_snapshot(team: str) -> Dict[str, Any]:
@@ -32,42 +46,83 @@ async def build_today_odds(
     games: List[Dict[str, Any]],
     client,
 ) -> TodayResponse:
-    matchups: List[MatchupResult] = []
+    # Prime the standings table and the goalie factor map concurrently
+    # before fanning out: otherwise the first snapshot build serializes
+    # both fetches while every other task waits on its cache entry. Only
+    # the clubs actually playing today need goalie factors.
+    needed = {g["homeAbbrev"] for g in games} | {g["awayAbbrev"] for g in games}
+    await asyncio.gather(
+        client._get_standings(today_str),
+        client._build_team_goalie_factor_map(only=needed),
+    )
 
-    for g in games:
-        home_abbrev = g["homeAbbrev"]
-        away_abbrev = g["awayAbbrev"]
+    # Gather inputs for the whole slate first so scoring can run as one
+    # vectorized batch instead of per-game Python loops.
+    # Each team's snapshot is fetched and parsed at most once per request,
+    # even if it shows up in several games; tasks (not results) are cached
+    # so concurrent games sharing a team await the same fetch.
+    snap_tasks: Dict[str, asyncio.Task] = {}
 
-        home_snap = await client.get_team_snapshot(home_abbrev, game_id=g["gameId"])
-        away_snap = await client.get_team_snapshot(away_abbrev, game_id=g["gameId"])
+    async def _load_snapshot(abbrev: str, game_id) -> Dict[str, Any]:
+        snap = await client.get_team_snapshot(abbrev, game_id=game_id)
+        if not snap:
+            snap = _default_snapshot(abbrev)
+        snap["team"] = abbrev
+        return snap
 
-        if not home_snap:
-            home_snap = _default_snapshot(home_abbrev)
-        home_snap["team"] = home_abbrev
+    def _snapshot(abbrev: str, game_id) -> asyncio.Task:
+        task = snap_tasks.get(abbrev)
+        if task is None:
+            task = asyncio.ensure_future(_load_snapshot(abbrev, game_id))
+            snap_tasks[abbrev] = task
+        return task
 
-        if not away_snap:
-            away_snap = _default_snapshot(away_abbrev)
-        away_snap["team"] = away_abbrev
+    async def _fetch_game(g):
+        return await asyncio.gather(
+            _snapshot(g["homeAbbrev"], g["gameId"]),
+            _snapshot(g["awayAbbrev"], g["gameId"]),
+            client.get_head_to_head_lastN(g["homeAbbrev"], g["awayAbbrev"], n=5),
+        )
 
-        h2h = await client.get_head_to_head_lastN(home_abbrev, away_abbrev, n=5)
+    # All per-game I/O fans out at once; NHLClient bounds in-flight HTTP
+    # requests with its own semaphore so the NHL API isn't hammered.
+    fetched = await asyncio.gather(*(_fetch_game(g) for g in games))
 
-        hs, as_, diff, p_home, p_away, ptg, breakdown = score_matchup(
-            home_snap,
-            away_snap,
-            h2h,
-        )
+    home_snaps: List[Dict[str, Any]] = [f[0] for f in fetched]
+    away_snaps: List[Dict[str, Any]] = [f[1] for f in fetched]
+    h2hs: List[Dict[str, Any] | None] = [f[2] for f in fetched]
 
+    snap_by_team: Dict[str, Dict[str, Any]] = {
+        ab: task.result() for ab, task in snap_tasks.items()
+    }
+
+    if NUMBA_AVAILABLE:
+        # numeric features per team, computed once and shared by every matchup
+        feature_map = {ab: team_features(snap) for ab, snap in snap_by_team.items()}
+        scored = score_batch(home_snaps, away_snaps, h2hs, feature_map)
+    elif score_all is not None:
+        scored = score_all(home_snaps, away_snaps, h2hs)
+    else:
+        scored = [
+            score_matchup_fused(home_snaps[i], away_snaps[i], h2hs[i])
+            for i in range(len(games))
+        ]
+
+    # All of this data was just computed by us, so build the response with
+    # model_construct and skip Pydantic's validation pass entirely.
+    matchups: List[MatchupResult] = []
+    for g, (hs, as_, diff, p_home, p_away, ptg, breakdown) in zip(games, scored):
         matchups.append(
-            MatchupResult(
+            MatchupResult.model_construct(
                 gameId=str(g["gameId"]),
                 date=today_str,
-                homeTeam=home_abbrev,
-                awayTeam=away_abbrev,
-                score=MatchupScore(home=hs, away=as_, diff=diff),
-                probability=MatchupProb(home=round(p_home, 4), away=round(p_away, 4)),
+                homeTeam=g["homeAbbrev"],
+                awayTeam=g["awayAbbrev"],
+                score=MatchupScore.model_construct(home=hs, away=as_, diff=diff),
+                probability=MatchupProb.model_construct(home=round(p_home, 4), away=round(p_away, 4)),
                 projectedTotalGoals=round(ptg, 2),
-                breakdown=breakdown,
+                breakdown=[EdgeBreakdown.model_construct(**asdict(e)) for e in breakdown],
             )
         )
 
-    return TodayResponse(date=today_str, matchups=matchups)
+    return TodayResponse.model_construct(date=today_str, matchups=matchups)